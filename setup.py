@@ -0,0 +1,45 @@
+"""
+Build the optional compiled DSI kernel in place.
+
+    python setup.py build_ext --inplace
+
+This script is not an installer: it only builds src/_dsi_core. Set
+DSI_MARCH_NATIVE=1 to compile with -march=native; the resulting binary
+is then only usable on CPUs like the one that built it.
+
+compute_dsi uses src/_dsi_core when it has been built and falls back
+to Numba or NumPy otherwise.
+"""
+
+import os
+import sys
+
+from setuptools import setup, Extension
+
+if "build_ext" not in sys.argv[1:]:
+    sys.exit(
+        "setup.py only builds the optional Cython kernel; run\n"
+        "    python setup.py build_ext --inplace"
+    )
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    sys.exit("Building src/_dsi_core requires Cython: pip install cython")
+
+compile_args = ["-O3", "-ffast-math"]
+if os.environ.get("DSI_MARCH_NATIVE") == "1":
+    compile_args.append("-march=native")
+
+extensions = [
+    Extension(
+        "src._dsi_core",
+        ["src/_dsi_core.pyx"],
+        extra_compile_args=compile_args,
+    )
+]
+
+setup(
+    name="riemann-dsi",
+    ext_modules=cythonize(extensions),
+)
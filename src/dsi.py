@@ -17,11 +17,172 @@ Reference values:
 - Sequence {1,2,...,N} under RH: DSI → 4/3 as N → ∞
 """
 
+import math
+
 import numpy as np
+import numpy.typing as npt
 from typing import Union, List, Tuple
 
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional; fall back to plain NumPy
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
+
+    prange = range
+
+try:
+    from scipy.linalg.blas import dasum
+    HAVE_SCIPY = True
+except ImportError:  # SciPy is optional; np.abs(...).sum() is used instead
+    HAVE_SCIPY = False
+
+try:  # Optional Cython kernel, built with `python setup.py build_ext --inplace`
+    try:
+        from ._dsi_core import var_mad_float64
+    except ImportError:  # imported as a top-level module from src/
+        from _dsi_core import var_mad_float64
+    HAVE_DSI_CORE = True
+except ImportError:
+    HAVE_DSI_CORE = False
+
+
+# Block length for the kernels' partial sums
+_KERNEL_BLOCK = 4096
+
+# Inputs at least this long use the multithreaded kernel
+_PARALLEL_MIN_SIZE = 100_000
+
+
+@njit(cache=True, fastmath=True)
+def _dsi_kernel(a):
+    """
+    Return (variance, MAD) of a 1-D float64 array in two passes.
+    
+    The first pass computes the mean, the second accumulates squared
+    and absolute deviations together, so no temporary ``a - mean``
+    array is allocated. Sums are accumulated per block, which keeps
+    rounding close to NumPy's pairwise summation.
+    """
+    n = a.shape[0]
+    total = 0.0
+    for lo in range(0, n, _KERNEL_BLOCK):
+        b = 0.0
+        for i in range(lo, min(lo + _KERNEL_BLOCK, n)):
+            b += a[i]
+        total += b
+    mean = total / n
+    
+    s2 = 0.0
+    s1 = 0.0
+    for lo in range(0, n, _KERNEL_BLOCK):
+        b2 = 0.0
+        b1 = 0.0
+        for i in range(lo, min(lo + _KERNEL_BLOCK, n)):
+            d = a[i] - mean
+            b2 += d * d
+            b1 += abs(d)
+        s2 += b2
+        s1 += b1
+    
+    return s2 / n, s1 / n
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def _dsi_kernel_parallel(a):
+    """
+    Multithreaded variant of ``_dsi_kernel`` for large arrays.
+    
+    Blocks are distributed across threads with ``prange``; each block's
+    partial sum is combined by Numba's parallel reduction.
+    """
+    n = a.shape[0]
+    n_blocks = (n + _KERNEL_BLOCK - 1) // _KERNEL_BLOCK
+    
+    total = 0.0
+    for b in prange(n_blocks):
+        lo = b * _KERNEL_BLOCK
+        hi = min(lo + _KERNEL_BLOCK, n)
+        part = 0.0
+        for i in range(lo, hi):
+            part += a[i]
+        total += part
+    mean = total / n
+    
+    s2 = 0.0
+    s1 = 0.0
+    for b in prange(n_blocks):
+        lo = b * _KERNEL_BLOCK
+        hi = min(lo + _KERNEL_BLOCK, n)
+        b2 = 0.0
+        b1 = 0.0
+        for i in range(lo, hi):
+            d = a[i] - mean
+            b2 += d * d
+            b1 += abs(d)
+        s2 += b2
+        s1 += b1
+    
+    return s2 / n, s1 / n
+
+
+def _dsi_arithmetic(n: int) -> float:
+    """
+    Exact DSI of an arithmetic progression of length n.
+    
+    DSI is invariant under shifting and scaling, so every progression
+    a, a+d, ..., a+(n-1)d with d != 0 has the DSI of {1, 2, ..., n}:
+    - Var = (n² - 1) / 12
+    - MAD = n / 4 for even n, (n² - 1) / (4n) for odd n
+    """
+    if n % 2 == 0:
+        return (4/3) * (1 - 1/(n**2))
+    return (4/3) * n**2 / (n**2 - 1)
+
 
-def compute_dsi(values: Union[List[float], np.ndarray]) -> float:
+# Chunk length for streaming reductions over a range (512 KB of float64)
+_RANGE_CHUNK = 65536
+
+
+def _dsi_from_range(values: range) -> float:
+    """
+    Compute DSI of a range numerically with ``math.fsum``, one chunk
+    at a time.
+    
+    The mean of an arithmetic progression is known exactly, so a single
+    streaming pass sums squared and absolute deviations over chunks of
+    ``_RANGE_CHUNK`` values, then sums the chunk totals. The working set
+    stays cache sized instead of materializing the whole sequence.
+    """
+    n = len(values)
+    if n < 2:
+        raise ValueError("Need at least 2 values to compute DSI")
+    
+    mean = (values[0] + values[-1]) / 2
+    s2 = []
+    s1 = []
+    for lo in range(0, n, _RANGE_CHUNK):
+        part = values[lo:lo + _RANGE_CHUNK]
+        chunk = np.arange(part.start, part.stop, part.step, dtype=np.float64)
+        chunk -= mean
+        s2.append(math.fsum((chunk * chunk).tolist()))
+        s1.append(math.fsum(np.abs(chunk, out=chunk).tolist()))
+    
+    return (math.fsum(s2) / n) / (math.fsum(s1) / n) ** 2
+
+
+def compute_dsi(
+    values: Union[List[float], np.ndarray],
+    dtype: npt.DTypeLike = np.float64,
+    *,
+    exact: bool = False
+) -> float:
     """
     Compute the Distributional Stability Index (DSI).
     
@@ -31,6 +192,16 @@ def compute_dsi(values: Union[List[float], np.ndarray]) -> float:
     ----------
     values : array-like
         Sequence of numerical values
+    dtype : numpy floating dtype, optional
+        Storage type for the input array. ``np.float32`` halves memory
+        traffic for large samples. The mean and deviations are always
+        computed in float64, so the DSI of float32 data matches the
+        float64 reduction of the same values to rounding.
+    exact : bool, optional
+        Reduce with ``math.fsum`` (correctly rounded sums) instead of
+        the fast kernels. Slower, but keeps verification against the
+        closed form robust for large N. A ``range`` is then reduced
+        numerically rather than returned in closed form.
         
     Returns
     -------
@@ -43,23 +214,66 @@ def compute_dsi(values: Union[List[float], np.ndarray]) -> float:
     1.2
     >>> compute_dsi(range(1, 101))  # Should be close to 4/3
     1.3332
+    
+    Notes
+    -----
+    A ``range`` input is an arithmetic progression, so its DSI is
+    returned in closed form without materializing the sequence.
     """
-    arr = np.array(values, dtype=float)
+    if isinstance(values, range):
+        if len(values) < 2:
+            raise ValueError("Need at least 2 values to compute DSI")
+        if exact:
+            return _dsi_from_range(values)
+        return _dsi_arithmetic(len(values))
+    
+    if not np.issubdtype(dtype, np.floating):
+        raise TypeError(f"dtype must be a floating type, got {np.dtype(dtype)}")
+    
+    arr = np.asarray(values, dtype=dtype)  # no copy if already dtype
     
     if len(arr) < 2:
         raise ValueError("Need at least 2 values to compute DSI")
     
-    # Population variance
-    variance = np.var(arr, ddof=0)
-    
-    # Mean absolute deviation
-    mean = np.mean(arr)
-    mad = np.mean(np.abs(arr - mean))
+    if exact:
+        # Correctly rounded sums in float64; the deviation temporaries
+        # are fine here. fsum is much faster over lists than arrays.
+        flat = arr.ravel().astype(np.float64, copy=False)
+        n = flat.size
+        d = flat - math.fsum(flat.tolist()) / n
+        variance = math.fsum((d * d).tolist()) / n
+        mad = math.fsum(np.abs(d).tolist()) / n
+    elif HAVE_NUMBA and arr.ndim == 1 and arr.size >= _PARALLEL_MIN_SIZE:
+        # Fused kernel: one pass for the mean, one for Var and MAD
+        variance, mad = _dsi_kernel_parallel(arr)
+    elif (HAVE_DSI_CORE and arr.ndim == 1 and arr.dtype == np.float64
+          and arr.flags.c_contiguous):
+        # Same fused kernel compiled with Cython; lowest call overhead
+        variance, mad = var_mad_float64(arr)
+    elif HAVE_NUMBA and arr.ndim == 1:
+        variance, mad = _dsi_kernel(arr)
+    else:
+        # Deviations from the mean in a single float64 scratch buffer,
+        # reduced with BLAS ddot/dasum
+        flat = arr.ravel()
+        n = flat.size
+        buf = np.empty(flat.shape, dtype=np.float64)
+        np.subtract(flat, flat.mean(dtype=np.float64), out=buf)
+        
+        # Population variance
+        variance = np.dot(buf, buf) / n
+        
+        # Mean absolute deviation
+        if HAVE_SCIPY:
+            mad = dasum(buf) / n
+        else:
+            np.abs(buf, out=buf)
+            mad = buf.sum() / n
     
     if mad == 0:
         raise ValueError("MAD is zero - all values are identical")
     
-    return variance / (mad ** 2)
+    return float(variance / (mad ** 2))
 
 
 def compute_dsi_theoretical(N: int) -> float:
@@ -97,6 +311,12 @@ def dsi_convergence_table(N_values: List[int] = None) -> List[Tuple[int, float,
     -------
     list of tuples
         Each tuple: (N, DSI_computed, |DSI - 4/3|)
+    
+    Notes
+    -----
+    Each entry comes from the closed form in ``compute_dsi`` (exact for
+    both parities of N), so the table costs O(len(N_values)) however
+    large the N values are.
     """
     if N_values is None:
         N_values = [10**k for k in range(2, 7)]
@@ -8,15 +8,84 @@ The model: Under RH, R_k = k (uniform spacing).
 With perturbation: some R_k are shifted, adding variance.
 """
 
+import functools
+
 import numpy as np
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from dsi import compute_dsi
 
 
+# Distinct N values whose base sequence / index order are kept alive;
+# each entry holds one N-length array (8N bytes)
+_CACHE_SIZE = 4
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _base_sequence(N: int) -> np.ndarray:
+    """Return the cached, read-only RH sequence R_k = k for k = 1..N."""
+    base = np.arange(1, N + 1, dtype=float)
+    base.flags.writeable = False
+    return base
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _default_permutation(N: int) -> np.ndarray:
+    """
+    Return the cached, read-only permutation of range(N) from
+    RandomState(42). Its first k entries are the indices chosen by
+    ``RandomState(42).choice(N, k, replace=False)``.
+    """
+    perm = np.random.RandomState(42).permutation(N)
+    perm.flags.writeable = False
+    return perm
+
+
+def _perturbed_dsi_closed_form(
+    N: int,
+    perturb_indices: np.ndarray,
+    perturbation_magnitude: float
+) -> float:
+    """
+    DSI of R_k = k, with R_k = k(1 + m) at the given indices, without
+    building R.
+    
+    With S1, S2 the sums of k and k² over 1..N and P1, P2 the same sums
+    over the perturbed set:
+    - sum(R) = S1 + m*P1
+    - sum(R²) = S2 + (2m + m²)*P2
+    The absolute deviations of the unperturbed values are the closed
+    form over all of 1..N minus those of the perturbed k, so the cost is
+    O(len(perturb_indices)) rather than O(N).
+    """
+    N = int(N)  # exact integer sums; np.int64 would overflow in S2
+    m = perturbation_magnitude
+    k = perturb_indices.astype(np.float64) + 1
+    
+    S1 = N * (N + 1) // 2
+    S2 = N * (N + 1) * (2 * N + 1) // 6
+    mean = (S1 + m * k.sum()) / N
+    variance = (S2 + (2 * m + m * m) * (k @ k)) / N - mean ** 2
+    
+    # sum_{k=1..N} |k - mean|, split at j = floor(mean)
+    j = min(max(int(np.floor(mean)), 0), N)
+    below = j * mean - j * (j + 1) // 2
+    above = (S1 - j * (j + 1) // 2) - (N - j) * mean
+    abs_dev = (below + above
+               - np.abs(k - mean).sum()
+               + np.abs(k * (1 + m) - mean).sum())
+    mad = abs_dev / N
+    
+    if mad == 0:
+        raise ValueError("MAD is zero - all values are identical")
+    
+    return float(variance / (mad ** 2))
+
+
 def compute_perturbed_dsi(
     N: int,
     perturbation_fraction: float,
-    perturbation_magnitude: float = 0.1
+    perturbation_magnitude: float = 0.1,
+    rng: Optional[np.random.Generator] = None
 ) -> float:
     """
     Compute DSI with perturbed sequence.
@@ -32,25 +101,49 @@ def compute_perturbed_dsi(
         Fraction of zeros to perturb (0 to 1)
     perturbation_magnitude : float
         Relative magnitude of perturbation
+    rng : numpy.random.Generator, optional
+        Source of the perturbed indices. Default: a private
+        RandomState(42), which reproduces the paper's tables without
+        touching NumPy's global random state.
         
     Returns
     -------
     float
         DSI of perturbed sequence
     """
-    # Base sequence: R_k = k (RH case)
-    R = np.arange(1, N + 1, dtype=float)
-    
     # Perturb a fraction of zeros
     n_perturb = int(N * perturbation_fraction)
-    if n_perturb > 0:
-        # Select random indices to perturb
-        np.random.seed(42)  # For reproducibility
-        perturb_indices = np.random.choice(N, n_perturb, replace=False)
-        
-        # Add perturbation: shift by a fraction of k
-        # This models zeros being off the critical line
-        R[perturb_indices] *= (1 + perturbation_magnitude)
+    if n_perturb <= 0:
+        # Base sequence: R_k = k (RH case), in closed form
+        return compute_dsi(range(1, N + 1))
+    if n_perturb > N:
+        raise ValueError(
+            "Cannot take a larger sample than population when 'replace=False'"
+        )
+    
+    # Select random indices to perturb
+    if rng is None:
+        # Same order as RandomState(42), for reproducibility
+        perturb_indices = _default_permutation(N)[:n_perturb]
+    else:
+        # Generator samples without a full permutation of N
+        perturb_indices = rng.choice(
+            N, size=n_perturb, replace=False, shuffle=False
+        )
+    
+    if perturbation_fraction <= 0.25:
+        # Sparse case: evaluate DSI from the perturbed set alone
+        return _perturbed_dsi_closed_form(
+            N, perturb_indices, perturbation_magnitude
+        )
+    
+    # Dense case: the closed form's cost approaches O(N) anyway, so build
+    # R and reduce it directly. Add perturbation: shift by a fraction of k
+    # This models zeros being off the critical line
+    R = _base_sequence(N).copy()
+    mask = np.zeros(N, dtype=bool)
+    mask[perturb_indices] = True
+    np.multiply(R, 1 + perturbation_magnitude, out=R, where=mask)
     
     return compute_dsi(R)
 
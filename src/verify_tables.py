@@ -26,10 +26,11 @@ def verify_reference_values():
     print(f"    DSI = (1/12) / (1/4)² = (1/12) / (1/16) = 4/3")
     print(f"    Computed:    {DSI_UNIFORM:.10f}")
     
-    # Numerical verification with samples
-    np.random.seed(42)
-    uniform_samples = np.random.uniform(0, 1, 1000000)
-    dsi_uniform_empirical = compute_dsi(uniform_samples)
+    # Numerical verification with samples; float32 halves the memory
+    # traffic and still resolves DSI far below the printed precision
+    rng = np.random.default_rng(42)
+    uniform_samples = rng.random(1000000, dtype=np.float32)
+    dsi_uniform_empirical = compute_dsi(uniform_samples, dtype=np.float32)
     print(f"    Empirical (10⁶ samples): {dsi_uniform_empirical:.6f}")
     
     # (b) Normal distribution
@@ -38,8 +39,8 @@ def verify_reference_values():
     print(f"    DSI = 1 / (2/π) = π/2")
     print(f"    Computed:    {DSI_NORMAL:.10f}")
     
-    normal_samples = np.random.normal(0, 1, 1000000)
-    dsi_normal_empirical = compute_dsi(normal_samples)
+    normal_samples = rng.standard_normal(1000000, dtype=np.float32)
+    dsi_normal_empirical = compute_dsi(normal_samples, dtype=np.float32)
     print(f"    Empirical (10⁶ samples): {dsi_normal_empirical:.6f}")
     
     print("\n" + "=" * 60)
@@ -56,7 +57,9 @@ def verify_convergence_formula():
     print("-" * 60)
     
     for N in [10, 100, 1000, 10000]:
-        computed = compute_dsi(range(1, N + 1))
+        # exact=True reduces the range numerically with math.fsum
+        # instead of returning the closed form being verified
+        computed = compute_dsi(range(1, N + 1), exact=True)
         formula = (4/3) * (1 - 1/(N**2))
         match = "✓" if abs(computed - formula) < 1e-10 else "✗"
         print(f"{N:>10} | {computed:>15.10f} | {formula:>15.10f} | {match:>8}")